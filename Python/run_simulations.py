@@ -3,6 +3,8 @@ from crapssim import Player
 from crapssim import strategy
 import sys 
 import os 
+from multiprocessing import Pool
+import numpy as np
 
 
 def run_printout(n_roll, n_shooter, bankroll, strategy, strategy_name, runout):
@@ -33,9 +35,7 @@ def run_simulation(n_sim, n_roll, bankroll, strategy, strategy_name, runout):
             table.add_player(Player(bankroll, strategy))
             table.run(n_roll, verbose=False, runout=runout)
             # write data to file
-            out = "{},{},{}".format(table.total_player_cash, bankroll, table.dice.n_rolls_)
-            f_out.write(str(out))
-            f_out.write(str('\n'))
+            f_out.write("{},{},{}\n".format(table.total_player_cash, bankroll, table.dice.n_rolls))
 
 def run_simulation_burnin(n_sim, n_roll, bankroll, strategy, strategy_name, burn_in=20, runout=True):
     runout_str = "_runout" if runout else ""
@@ -54,38 +54,51 @@ def run_simulation_burnin(n_sim, n_roll, bankroll, strategy, strategy_name, burn
             burn_in_bankroll = table.total_player_cash
             table.run(n_roll, verbose=False, runout=runout)
             # write data to file
-            out = "{},{},{}".format(table.total_player_cash, burn_in_bankroll, table.dice.n_rolls_)
-            f_out.write(str(out))
-            f_out.write(str('\n'))
-
-def run_multi_simulation(n_sim, n_roll, n_shooter, bankroll, strategy, name, runout=True):
+            f_out.write("{},{},{}\n".format(table.total_player_cash, burn_in_bankroll, table.dice.n_rolls))
+
+def _simulate_table(args):
+    """ Run one table for run_multi_simulation; returns (strategy, bankroll, starting bankroll, n_rolls) per player """
+    seed, n_roll, n_shooter, bankroll, strategy, runout = args
+    if seed is not None:
+        np.random.seed(seed)
+    table = Table()
+    table.set_payouts("fielddouble", [2])
+    table.set_payouts("fieldtriple", [12])
+    for bank, s in zip(bankroll, strategy):
+        table.add_player(Player(bank, strategy[s], s))
+    table.run(n_roll, n_shooter, verbose=False, runout=runout)
+    return [(s, table._get_player(s).bankroll, bank, table.dice.n_rolls) for bank, s in zip(bankroll, strategy)]
+
+def run_multi_simulation(n_sim, n_roll, n_shooter, bankroll, strategy, name, runout=True, processes=1):
     runout_str = "_runout" if runout else ""
     # Run simulation of n_roll rolls (estimated rolls/hour with 5 players) 1000 times
     outfile_name = "./output/simulations/{}_sim-{}_roll-{}_br-{}_burnin{}.txt".format(name, n_sim, n_roll, bankroll, runout_str)
     print("Running simulations for {}_sim-{}_roll-{}_br-{}_burnin{}.txt".format(name, n_sim, n_roll, bankroll, runout_str))
+    # Tables are independent, so with processes > 1 they are spread over a pool of workers.
+    # Workers would all inherit this process's RNG state, so each table gets its own seed,
+    # drawn from the global RNG so np.random.seed still makes a pooled run reproducible
+    if processes > 1:
+        seeds = np.random.randint(2 ** 32, size=n_sim, dtype="uint32")
+    else:
+        seeds = [None] * n_sim
+    jobs = ((seed, n_roll, n_shooter, bankroll, strategy, runout) for seed in seeds)
     with open(outfile_name, 'w') as f_out:
         # Headers to match out
         f_out.write("simid,strategy,total_cash,bankroll,n_rolls") 
         f_out.write(str('\n'))
-        for i in range(n_sim):
+        if processes > 1:
+            with Pool(processes) as pool:
+                results = pool.map(_simulate_table, jobs, chunksize=max(1, n_sim // (4 * processes)))
+        else:
+            results = map(_simulate_table, jobs)
+        for i, players in enumerate(results):
             if i % 1000 == 0:
                 print(f"i: {i}")
-            table = Table() 
-            table.set_payouts("fielddouble", [2])
-            table.set_payouts("fieldtriple", [12])
-            for bank, s in zip(bankroll, strategy):
-                table.add_player(Player(bank, strategy[s], s))
-
-            # table.run(burn_in, verbose=False, runout=False)
-            # burn_in_bankroll = table.total_player_cash
-            table.run(n_roll, n_shooter, verbose=False, runout=runout)
             # write data to file
-            # TODO: get actual player cash 
-            for bank, s in zip(bankroll, strategy):
-                out = f"{i},{s},{table._get_player(s).bankroll},{bank},{table.dice.n_rolls}"
-                # out = "{},{},{},{}".format(s, table.total_player_cash, bank, table.dice.n_rolls_)
-                f_out.write(str(out))
-                f_out.write(str('\n'))
+            f_out.write("".join(
+                f"{i},{s},{player_bankroll},{bank},{n_rolls}\n"
+                for s, player_bankroll, bank, n_rolls in players
+            ))
 
 
 
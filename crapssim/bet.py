@@ -1,5 +1,9 @@
 from crapssim.dice import Dice
 
+# true odds payout ratio for odds behind a point, keyed by point number
+_ODDS_PAYOUT = {4: 2 / 1, 5: 3 / 2, 6: 6 / 5, 8: 6 / 5, 9: 3 / 2, 10: 2 / 1}
+# true odds payout ratio for laying odds against a point, keyed by point number
+_LAY_ODDS_PAYOUT = {4: 1 / 2, 5: 2 / 3, 6: 5 / 6, 8: 5 / 6, 9: 2 / 3, 10: 1 / 2}
 
 class Bet(object):
     """
@@ -35,8 +39,8 @@ class Bet(object):
     def __init__(self, bet_amount):
         self.bet_amount = float(bet_amount)
 
-    # def __eq__(self, other):
-    #     return self.name == other.name
+    # Bets compare by identity: once placed, each instance tracks its own
+    # point, so two bets of the same type and amount are not interchangeable.
 
     def _update_bet(self, table_object, dice_object: Dice):
         status = None
@@ -109,12 +113,10 @@ class Odds(Bet):
         self.winning_numbers = bet_object.winning_numbers
         self.losing_numbers = bet_object.losing_numbers
 
-        if self.winning_numbers == [4] or self.winning_numbers == [10]:
-            self.payoutratio = 2 / 1
-        elif self.winning_numbers == [5] or self.winning_numbers == [9]:
-            self.payoutratio = 3 / 2
-        elif self.winning_numbers == [6] or self.winning_numbers == [8]:
-            self.payoutratio = 6 / 5
+        if len(self.winning_numbers) == 1:
+            self.payoutratio = _ODDS_PAYOUT.get(
+                self.winning_numbers[0], self.payoutratio
+            )
 
 
 """
@@ -123,15 +125,20 @@ Place Bets on 4,5,6,8,9,10
 
 
 class Place(Bet):
+    # the place number, set on each subclass
+    number = None
+
     def _update_bet(self, table_object, dice_object):
         # place bets are inactive when point is "Off"
-        if table_object.point == "On":
+        if table_object.point.status == "On":
             return super()._update_bet(table_object, dice_object)
         else:
             return None, 0
 
 
 class Place4(Place):
+    number = 4
+
     def __init__(self, bet_amount):
         self.name = "Place4"
         self.winning_numbers = [4]
@@ -141,6 +148,8 @@ class Place4(Place):
 
 
 class Place5(Place):
+    number = 5
+
     def __init__(self, bet_amount):
         self.name = "Place5"
         self.winning_numbers = [5]
@@ -150,6 +159,8 @@ class Place5(Place):
 
 
 class Place6(Place):
+    number = 6
+
     def __init__(self, bet_amount):
         self.name = "Place6"
         self.winning_numbers = [6]
@@ -159,6 +170,8 @@ class Place6(Place):
 
 
 class Place8(Place):
+    number = 8
+
     def __init__(self, bet_amount):
         self.name = "Place8"
         self.winning_numbers = [8]
@@ -168,6 +181,8 @@ class Place8(Place):
 
 
 class Place9(Place):
+    number = 9
+
     def __init__(self, bet_amount):
         self.name = "Place9"
         self.winning_numbers = [9]
@@ -177,6 +192,8 @@ class Place9(Place):
 
 
 class Place10(Place):
+    number = 10
+
     def __init__(self, bet_amount):
         self.name = "Place10"
         self.winning_numbers = [10]
@@ -200,12 +217,13 @@ class Field(Bet):
         Set of numbers that pay triple on the field bet (default = [])
     """
 
+    winning_numbers = [2, 3, 4, 9, 10, 11, 12]
+    losing_numbers = [5, 6, 7, 8]
+
     def __init__(self, bet_amount, double=[2, 12], triple=[]):
         self.name = "Field"
         self.double_winning_numbers = double
         self.triple_winning_numbers = triple
-        self.winning_numbers = [2, 3, 4, 9, 10, 11, 12]
-        self.losing_numbers = [5, 6, 7, 8]
         super().__init__(bet_amount)
 
     def _update_bet(self, table_object, dice_object):
@@ -277,9 +295,7 @@ class LayOdds(Bet):
         self.winning_numbers = bet_object.winning_numbers
         self.losing_numbers = bet_object.losing_numbers
 
-        if self.losing_numbers == [4] or self.losing_numbers == [10]:
-            self.payoutratio = 1 / 2
-        elif self.losing_numbers == [5] or self.losing_numbers == [9]:
-            self.payoutratio = 2 / 3
-        elif self.losing_numbers == [6] or self.losing_numbers == [8]:
-            self.payoutratio = 5 / 6
+        if len(self.losing_numbers) == 1:
+            self.payoutratio = _LAY_ODDS_PAYOUT.get(
+                self.losing_numbers[0], self.payoutratio
+            )
@@ -20,13 +20,29 @@ class Dice(object):
 
     """
 
+    __slots__ = ("n_rolls", "result", "total", "_rolls", "_totals", "_next_roll")
+
+    # rolls are drawn from numpy this many at a time, since one call per
+    # roll costs more than the rest of rolling
+    _BLOCK_SIZE = 256
+
     def __init__(self):
         self.n_rolls = 0
+        self._rolls = ()
+        self._totals = []
+        self._next_roll = 0
 
     def roll(self):
         self.n_rolls += 1
-        self.result = r.randint(1, 7, size=2)
-        self.total = sum(self.result)
+        if self._next_roll == len(self._rolls):
+            self._rolls = r.randint(1, 7, size=(self._BLOCK_SIZE, 2))
+            # totals for the whole block at once, as plain ints so bet checks
+            # compare native ints
+            self._totals = self._rolls.sum(axis=1).tolist()
+            self._next_roll = 0
+        self.result = self._rolls[self._next_roll]
+        self.total = self._totals[self._next_roll]
+        self._next_roll += 1
 
     def fixed_roll(self, outcome):
         self.n_rolls += 1
@@ -19,80 +19,131 @@ class Player(object):
         Sum of bet value for the player
     """
 
+    __slots__ = (
+        "bankroll",
+        "bet_strategy",
+        "name",
+        "bets_on_table",
+        "_bets_by_type",
+        "_bet_name_counts",
+        "total_bet_amount",
+    )
+
     def __init__(self, bankroll, bet_strategy=None, name="Player"):
         self.bankroll = bankroll
         self.bet_strategy = bet_strategy
         self.name = name
         self.bets_on_table = []
+        self._bets_by_type = {}
+        self._bet_name_counts = {}
         self.total_bet_amount = 0
         # TODO: initial betting strategy
 
     def bet(self, bet_object):
         if self.bankroll >= bet_object.bet_amount:
             self.bankroll -= bet_object.bet_amount
-            self.bets_on_table.append(
+            self._add_to_table(
                 bet_object
             )  # TODO: make sure this only happens if that bet isn't on the table, otherwise wager amount gets updated
             self.total_bet_amount += bet_object.bet_amount
 
     def remove(self, bet_object):
         # TODO: add bet attribute for whether a bet can be removed and put condition in here
-        if bet_object in self.bets_on_table:
+        # the bet's own type bucket is much shorter than bets_on_table
+        if bet_object in self._bets_by_type.get(type(bet_object), ()):
             self.bankroll += bet_object.bet_amount
-            self.bets_on_table.remove(bet_object)
+            self._remove_from_table(bet_object)
             self.total_bet_amount -= bet_object.bet_amount
 
     def has_bet(self, *bets_to_check):
         """ returns True if bets_to_check and self.bets_on_table has at least one thing in common """
-        bet_names = {b.name for b in self.bets_on_table}
-        return bool(bet_names.intersection(bets_to_check))
+        for bet_name in bets_to_check:
+            if bet_name in self._bet_name_counts:
+                return True
+        return False
 
     def get_bet(self, bet_name, bet_subname=""):
         """returns first betting object matching bet_name and bet_subname.
         If bet_subname="Any", returns first betting object matching bet_name"""
-        if bet_subname == "Any":
-            bet_name_list = [b.name for b in self.bets_on_table]
-            ind = bet_name_list.index(bet_name)
-        else:
-            bet_name_list = [[b.name, b.subname] for b in self.bets_on_table]
-            ind = bet_name_list.index([bet_name, bet_subname])
-        return self.bets_on_table[ind]
+        for b in self.bets_on_table:
+            if b.name == bet_name and (bet_subname == "Any" or b.subname == bet_subname):
+                return b
+        raise ValueError(f"no {bet_name} bet with subname {bet_subname!r} on the table")
+
+    def get_bets_by_type(self, *bet_types):
+        """ returns a tuple of the bets in self.bets_on_table that are instances of any of bet_types """
+        if len(bet_types) == 1:
+            return tuple(self._bets_by_type.get(bet_types[0], ()))
+        return tuple(b for b in self.bets_on_table if isinstance(b, bet_types))
 
     def num_bet(self, *bets_to_check):
         """ returns the total number of bets in self.bets_on_table that match bets_to_check """
-        bet_names = [b.name for b in self.bets_on_table]
-        return sum([i in bets_to_check for i in bet_names])
+        n_bets = 0
+        for bet_name in set(bets_to_check):
+            n_bets += self._bet_name_counts.get(bet_name, 0)
+        return n_bets
 
     def remove_if_present(self, bet_name, bet_subname=""):
         if self.has_bet(bet_name):
             self.remove(self.get_bet(bet_name, bet_subname))
 
-    def _add_strategy_bets(self, table, *args, **kwargs):
+    def _add_to_table(self, bet_object):
+        """ add bet_object to self.bets_on_table, indexed under each of its bet classes and its name """
+        self.bets_on_table.append(bet_object)
+        for bet_type in type(bet_object).__mro__[:-1]:
+            self._bets_by_type.setdefault(bet_type, []).append(bet_object)
+        name = bet_object.name
+        self._bet_name_counts[name] = self._bet_name_counts.get(name, 0) + 1
+
+    def _remove_from_table(self, bet_object):
+        """ remove bet_object from self.bets_on_table and its bet class and name indexes """
+        self.bets_on_table.remove(bet_object)
+        self._unindex_bet(bet_object)
+
+    def _unindex_bet(self, bet_object):
+        """ remove bet_object from the bet class and name indexes only """
+        for bet_type in type(bet_object).__mro__[:-1]:
+            self._bets_by_type[bet_type].remove(bet_object)
+        name = bet_object.name
+        if self._bet_name_counts[name] == 1:
+            del self._bet_name_counts[name]
+        else:
+            self._bet_name_counts[name] -= 1
+
+    def _add_strategy_bets(self, table, unit=5, strat_info=None):
         """ Implement the given betting strategy """
-        return self.bet_strategy(self, table, *args, **kwargs)
+        return self.bet_strategy(self, table, unit=unit, strat_info=strat_info)
 
     def _update_bet(self, table_object, dice_object, verbose=False):
         info = {}
-        for b in self.bets_on_table[:]:
+        bets_still_up = []
+        for b in self.bets_on_table:
             status, win_amount = b._update_bet(table_object, dice_object)
 
-            if status == "win":
+            if status is None:
+                # most bets stay up on a given roll
+                bets_still_up.append(b)
+            elif status == "win":
                 self.bankroll += win_amount + b.bet_amount
                 self.total_bet_amount -= b.bet_amount
-                self.bets_on_table.remove(b)
+                self._unindex_bet(b)
                 if verbose:
                     print(f"{self.name} won ${win_amount} on {b.name} bet!")
             elif status == "lose":
                 self.total_bet_amount -= b.bet_amount
-                self.bets_on_table.remove(b)
+                self._unindex_bet(b)
                 if verbose:
                     print(f"{self.name} lost ${b.bet_amount} on {b.name} bet.")
             elif status == "push":
                 self.bankroll += b.bet_amount
                 self.total_bet_amount -= b.bet_amount
-                self.bets_on_table.remove(b)
+                self._unindex_bet(b)
                 if verbose:
                     print(f"{self.name} pushed ${b.bet_amount} on {b.name} bet.")
+            else:
+                bets_still_up.append(b)
 
             info[b.name] = {"status": status, "win_amount": win_amount}
+        # drop all resolved bets at once instead of removing them one by one
+        self.bets_on_table[:] = bets_still_up
         return info
@@ -9,6 +9,49 @@ Each strategy must take a table and a player_object, and implicitly
 uses the methods from the player object.
 """
 
+# 3-4-5x odds multiplier, indexed by point number
+_ODDS_345_MULT = (0, 0, 0, 0, 3, 4, 5, 0, 5, 4, 3)
+# lay odds needed to win one unit, indexed by point number
+_LAY_ODDS_MULT = (0, 0, 0, 0, 2, 3 / 2, 6 / 5, 0, 6 / 5, 3 / 2, 2)
+
+# (number, bet name, bet class, unit multiplier) for each place bet
+_PLACE_BETS = (
+    (4, "Place4", Place4, 1),
+    (5, "Place5", Place5, 1),
+    (6, "Place6", Place6, 6 / 5),
+    (8, "Place8", Place8, 6 / 5),
+    (9, "Place9", Place9, 1),
+    (10, "Place10", Place10, 1),
+)
+# Place bet class, indexed by place number
+_PLACE_BET_BY_NUMBER = (
+    None, None, None, None, Place4, Place5, Place6, None, Place8, Place9, Place10
+)
+
+# Fixed groups of place numbers
+_NUMBERS_68 = frozenset({6, 8})
+_NUMBERS_5689 = frozenset({5, 6, 8, 9})
+
+# Fixed number selections passed to place() as strat_info
+_PLACE_6 = {"numbers": frozenset({6})}
+_PLACE_8 = {"numbers": frozenset({8})}
+_PLACE_68 = {"numbers": _NUMBERS_68}
+_PLACE_568 = {"numbers": frozenset({5, 6, 8})}
+_PLACE_5689 = {"numbers": _NUMBERS_5689}
+
+# Empty number selection, shared when a player has no place bets up
+_NO_NUMBERS = frozenset()
+
+# (bet name, bet class, strat_info mode key) for place68_cpr
+_CPR_BETS = (("Place6", Place6, "mode6"), ("Place8", Place8, "mode8"))
+# Mode that follows each place68_cpr mode after a win
+_CPR_NEXT_MODE = {"collect": "press", "press": "regress", "regress": "collect"}
+
+# dicedoctor field bet progression, in units
+_DICEDOCTOR_PROGRESSION = tuple(
+    amount / 5 for amount in (10, 20, 15, 30, 25, 50, 35, 70, 50, 100, 75, 150)
+)
+
 """
 Fundamental Strategies
 """
@@ -16,103 +59,106 @@ Fundamental Strategies
 
 def passline(player, table, unit=5, strat_info=None):
     # Pass line bet
-    if table.point == "Off" and not player.has_bet("PassLine"):
+    if table.point.status == "Off" and not player.has_bet("PassLine"):
         player.bet(PassLine(unit))
 
 
 def passline_odds(player, table, unit=5, strat_info=None, mult=1):
     passline(player, table, unit)
-    # Pass line odds
+    # Pass line odds only go up once the point is on
+    if table.point.status == "Off":
+        return
+
     if mult == "345":
-        if table.point == "On":
-            if table.point.number in [4, 10]:
-                mult = 3
-            elif table.point.number in [5, 9]:
-                mult = 4
-            elif table.point.number in [6, 8]:
-                mult = 5
+        mult = _ODDS_345_MULT[table.point.number]
     else:
         mult = float(mult)
+    _passline_odds_bet(player, mult * unit)
+
+
+def _pass_line_bet(player):
+    """ the player's pass line bet, or None if there isn't one """
+    # Come bets are also PassLine instances, so match the exact type
+    for bet in player.get_bets_by_type(PassLine):
+        if type(bet) is PassLine:
+            return bet
+    return None
 
-    if (
-        table.point == "On"
-        and player.has_bet("PassLine")
-        and not player.has_bet("Odds")
-    ):
-        player.bet(Odds(mult * unit, player.get_bet("PassLine")))
+
+def _passline_odds_bet(player, amount):
+    """ bet amount in odds behind the pass line, unless odds are already up """
+    if not player.get_bets_by_type(Odds):
+        passline_bet = _pass_line_bet(player)
+        if passline_bet is not None:
+            player.bet(Odds(amount, passline_bet))
 
 
 def passline_odds2(player, table, unit=5, strat_info=None):
-    passline_odds(player, table, unit, strat_info=None, mult=2)
+    passline(player, table, unit)
+    if table.point.status == "Off":
+        return
+    _passline_odds_bet(player, 2.0 * unit)
 
 
 def passline_odds345(player, table, unit=5, strat_info=None):
-    passline_odds(player, table, unit, strat_info=None, mult="345")
+    passline(player, table, unit)
+    if table.point.status == "Off":
+        return
+    _passline_odds_bet(player, _ODDS_345_MULT[table.point.number] * unit)
 
 
 def pass2come(player, table, unit=5, strat_info=None):
     passline(player, table, unit)
 
     # Come bet (2)
-    if table.point == "On" and player.num_bet("Come") < 2:
+    if table.point.status == "On" and player.num_bet("Come") < 2:
         player.bet(Come(unit))
 
 
-def place(player, table, unit=5, strat_info={"numbers": {6, 8}}, skip_point=True):
-    strat_info["numbers"] = set(strat_info["numbers"]).intersection({4, 5, 6, 8, 9, 10})
-    if skip_point:
-        strat_info["numbers"] -= {table.point.number}
-
-    # Place the provided numbers when point is ON
-    if table.point == "On":
-        if not player.has_bet("Place4") and 4 in strat_info["numbers"]:
-            player.bet(Place4(unit))
-        if not player.has_bet("Place5") and 5 in strat_info["numbers"]:
-            player.bet(Place5(unit))
-        if not player.has_bet("Place6") and 6 in strat_info["numbers"]:
-            player.bet(Place6(6 / 5 * unit))
-        if not player.has_bet("Place8") and 8 in strat_info["numbers"]:
-            player.bet(Place8(6 / 5 * unit))
-        if not player.has_bet("Place9") and 9 in strat_info["numbers"]:
-            player.bet(Place9(unit))
-        if not player.has_bet("Place10") and 10 in strat_info["numbers"]:
-            player.bet(Place10(unit))
+def place(player, table, unit=5, strat_info=_PLACE_68, skip_point=True):
+    # Place bets are only made or moved when point is ON
+    if table.point.status == "Off":
+        return
+    point_number = table.point.number
+
+    numbers = strat_info["numbers"]
+    skip_number = point_number if skip_point else None
+
+    # Place the provided numbers; _PLACE_BETS only holds valid place numbers
+    for number, name, place_bet, mult in _PLACE_BETS:
+        if number in numbers and number != skip_number and not player.has_bet(name):
+            player.bet(place_bet(mult * unit))
 
     # Move the bets off the point number if it shows up later
-    if skip_point and table.point == "On":
-        if player.has_bet("Place4") and table.point.number == 4:
-            player.remove(player.get_bet("Place4"))
-        if player.has_bet("Place5") and table.point.number == 5:
-            player.remove(player.get_bet("Place5"))
-        if player.has_bet("Place6") and table.point.number == 6:
-            player.remove(player.get_bet("Place6"))
-        if player.has_bet("Place8") and table.point.number == 8:
-            player.remove(player.get_bet("Place8"))
-        if player.has_bet("Place9") and table.point.number == 9:
-            player.remove(player.get_bet("Place9"))
-        if player.has_bet("Place10") and table.point.number == 10:
-            player.remove(player.get_bet("Place10"))
+    if skip_point:
+        point_bets = player.get_bets_by_type(_PLACE_BET_BY_NUMBER[point_number])
+        if point_bets:
+            player.remove(point_bets[0])
+
+
+def _remove_place_bets(player, numbers):
+    """ take down the player's place bets on any of numbers """
+    for bet in player.get_bets_by_type(Place):
+        if bet.number in numbers:
+            player.remove(bet)
 
 
 def place68(player, table, unit=5, strat_info=None):
     passline(player, table, unit, strat_info=None)
     # Place 6 and 8 when point is ON
-    p_has_place_bets = player.has_bet(
-        "Place4", "Place5", "Place6", "Place8", "Place9", "Place10"
-    )
-    if table.point == "On" and not p_has_place_bets:
-        if table.point.number == 6:
-            player.bet(Place8(6 / 5 * unit))
-        elif table.point.number == 8:
-            player.bet(Place6(6 / 5 * unit))
-        else:
-            player.bet(Place8(6 / 5 * unit))
-            player.bet(Place6(6 / 5 * unit))
+    if table.point.status == "On" and not player.get_bets_by_type(Place):
+        # skip whichever of 6 and 8 is the point
+        point_number = table.point.number
+        amount = 6 / 5 * unit
+        if point_number != 8:
+            player.bet(Place8(amount))
+        if point_number != 6:
+            player.bet(Place6(amount))
 
 
 def dontpass(player, table, unit=5, strat_info=None):
     # Don't pass bet
-    if table.point == "Off" and not player.has_bet("DontPass"):
+    if table.point.status == "Off" and not player.has_bet("DontPass"):
         player.bet(DontPass(unit))
 
 
@@ -121,26 +167,25 @@ def layodds(player, table, unit=5, strat_info=None, win_mult=1):
     # well to the max_odds on a table.
     # For `win_mult` = "345", this assumes max of 3-4-5x odds
     dontpass(player, table, unit)
+    # Lay odds only go up once the point is on
+    if table.point.status == "Off":
+        return
 
     # Lay odds for don't pass
     if win_mult == "345":
         mult = 6.0
     else:
-        win_mult = float(win_mult)
-        if table.point == "On":
-            if table.point.number in [4, 10]:
-                mult = 2 * win_mult
-            elif table.point.number in [5, 9]:
-                mult = 3 / 2 * win_mult
-            elif table.point.number in [6, 8]:
-                mult = 6 / 5 * win_mult
-
-    if (
-        table.point == "On"
-        and player.has_bet("DontPass")
-        and not player.has_bet("LayOdds")
-    ):
-        player.bet(LayOdds(mult * unit, player.get_bet("DontPass")))
+        mult = _LAY_ODDS_MULT[table.point.number] * float(win_mult)
+
+    _layodds_bet(player, mult * unit)
+
+
+def _layodds_bet(player, amount):
+    """ lay amount in odds against the don't pass point, unless odds are already up """
+    if not player.get_bets_by_type(LayOdds):
+        dontpass_bets = player.get_bets_by_type(DontPass)
+        if dontpass_bets:
+            player.bet(LayOdds(amount, dontpass_bets[0]))
 
 
 """
@@ -153,169 +198,183 @@ def place68_2come(player, table, unit=5, strat_info=None):
     Once point is established, place 6 and 8, with 2 additional come bets.
     The goal is to be on four distinct numbers, moving place bets if necessary
     """
-    current_numbers = []
+    point_on = table.point.status == "On"
+    current_numbers = set()
     for bet in player.bets_on_table:
-        current_numbers += bet.winning_numbers
-    current_numbers = list(set(current_numbers))
+        current_numbers.update(bet.winning_numbers)
 
-    if table.point == "On" and len(player.bets_on_table) < 4:
+    if point_on and len(player.bets_on_table) < 4:
         # always place 6 and 8 when they aren't come bets or place bets already
+        amount = 6 / 5 * unit
         if 6 not in current_numbers:
-            player.bet(Place6(6 / 5 * unit))
+            player.bet(Place6(amount))
         if 8 not in current_numbers:
-            player.bet(Place8(6 / 5 * unit))
+            player.bet(Place8(amount))
 
-    # add come of passline bets to get on 4 numbers
-    if player.num_bet("Come", "PassLine") < 2 and len(player.bets_on_table) < 4:
-        if table.point == "On":
+    # add come of passline bets to get on 4 numbers; Come bets are PassLine instances
+    n_line_bets = len(player.get_bets_by_type(PassLine))
+    if n_line_bets < 2 and len(player.bets_on_table) < 4:
+        if point_on:
             player.bet(Come(unit))
-        if table.point == "Off" and (
-            player.has_bet("Place6") or player.has_bet("Place8")
-        ):
+        elif player.has_bet("Place6", "Place8"):
             player.bet(PassLine(unit))
 
     # if come bet or passline goes to 6 or 8, move place bets to 5 or 9
-    pass_come_winning_numbers = []
-    if player.has_bet("PassLine"):
-        pass_come_winning_numbers += player.get_bet("PassLine").winning_numbers
-    if player.has_bet("Come"):
-        pass_come_winning_numbers += player.get_bet("Come", "Any").winning_numbers
+    pass_come_winning_numbers = set()
+    passline_bet = _pass_line_bet(player)
+    if passline_bet is not None:
+        pass_come_winning_numbers.update(passline_bet.winning_numbers)
+    come_bets = player.get_bets_by_type(Come)
+    if come_bets:
+        pass_come_winning_numbers.update(come_bets[0].winning_numbers)
 
     if 6 in pass_come_winning_numbers:
-        if player.has_bet("Place6"):
-            player.remove(player.get_bet("Place6"))
-        if 5 not in current_numbers:
-            player.bet(Place5(unit))
-        elif 9 not in current_numbers:
-            player.bet(Place9(unit))
+        _remove_place_bets(player, (6,))
     elif 8 in pass_come_winning_numbers:
-        if player.has_bet("Place8"):
-            player.remove(player.get_bet("Place8"))
-        if 5 not in current_numbers:
-            player.bet(Place5(unit))
-        elif 9 not in current_numbers:
-            player.bet(Place9(unit))
+        _remove_place_bets(player, (8,))
+    else:
+        return
+
+    if 5 not in current_numbers:
+        player.bet(Place5(unit))
+    elif 9 not in current_numbers:
+        player.bet(Place9(unit))
 
 
 def ironcross(player, table, unit=5, strat_info=None):
-    passline(player, table, unit)
-    passline_odds(player, table, unit, strat_info=None, mult=2)
-    place(player, table, 2 * unit, strat_info={"numbers": {5, 6, 8}})
-
-    if table.point == "On":
-        if not player.has_bet("Field"):
-            player.bet(
-                Field(
-                    unit,
-                    double=table.payouts["fielddouble"],
-                    triple=table.payouts["fieldtriple"],
-                )
+    # passline_odds2 also makes the pass line bet
+    passline_odds2(player, table, unit)
+    # place bets and the field only go up once the point is on
+    if table.point.status == "Off":
+        return
+
+    place(player, table, 2 * unit, strat_info=_PLACE_568)
+    if not player.has_bet("Field"):
+        player.bet(
+            Field(
+                unit,
+                double=table.payouts["fielddouble"],
+                triple=table.payouts["fieldtriple"],
             )
+        )
+
+
+def _hammerlock_place68(player, table, unit, strat_info, place_nums):
+    has_place68 = not place_nums.isdisjoint(_NUMBERS_68)
+    if has_place68 and place_nums != _NUMBERS_68:
+        # assume that a place 6/8 has won
+        _remove_place_bets(player, _NUMBERS_68)
+        strat_info["mode"] = "place_inside"
+        place(
+            player,
+            table,
+            unit,
+            strat_info=_PLACE_5689,
+            skip_point=False,
+        )
+    else:
+        place(
+            player,
+            table,
+            2 * unit,
+            strat_info=_PLACE_68,
+            skip_point=False,
+        )
+    return strat_info
+
+
+def _hammerlock_place_inside(player, table, unit, strat_info, place_nums):
+    has_place5689 = not place_nums.isdisjoint(_NUMBERS_5689)
+    if has_place5689 and place_nums != _NUMBERS_5689:
+        # assume that a place 5/6/8/9 has won
+        _remove_place_bets(player, _NUMBERS_5689)
+        strat_info["mode"] = "takedown"
+    else:
+        place(
+            player,
+            table,
+            unit,
+            strat_info=_PLACE_5689,
+            skip_point=False,
+        )
+    return strat_info
 
 
 def hammerlock(player, table, unit=5, strat_info=None):
     passline(player, table, unit)
-    layodds(player, table, unit, win_mult="345")
+    dontpass(player, table, unit)
+    if table.point.status == "On":
+        # 3-4-5x lay odds always win 6 units
+        _layodds_bet(player, 6.0 * unit)
 
-    place_nums = set()
-    for bet in player.bets_on_table:
-        if isinstance(bet, Place):
-            place_nums.add(bet.winning_numbers[0])
-    place_point_nums = place_nums.copy()
-    place_point_nums.add(table.point.number)
-
-    has_place68 = (6 in place_nums) or (8 in place_nums)
-    has_place5689 = (
-        (5 in place_nums) or (6 in place_nums) or (8 in place_nums) or (9 in place_nums)
-    )
+    place_bets = player.get_bets_by_type(Place)
+    if place_bets:
+        place_nums = {bet.number for bet in place_bets}
+    else:
+        place_nums = _NO_NUMBERS
 
     # 3 phases, place68, place_inside, takedown
-    if strat_info is None or table.point == "Off":
-        strat_info = {"mode": "place68"}
-        for bet_nm in ["Place5", "Place6", "Place8", "Place9"]:
-            player.remove_if_present(bet_nm)
-
-    if strat_info["mode"] == "place68":
-        if table.point == "On" and has_place68 and place_nums != {6, 8}:
-            # assume that a place 6/8 has won
-            if player.has_bet("Place6"):
-                player.remove(player.get_bet("Place6"))
-            if player.has_bet("Place8"):
-                player.remove(player.get_bet("Place8"))
-            strat_info["mode"] = "place_inside"
-            place(
-                player,
-                table,
-                unit,
-                strat_info={"numbers": {5, 6, 8, 9}},
-                skip_point=False,
-            )
+    point_off = table.point.status == "Off"
+    if strat_info is None or point_off:
+        if strat_info is None:
+            strat_info = {"mode": "place68"}
         else:
-            place(
-                player,
-                table,
-                2 * unit,
-                strat_info={"numbers": {6, 8}},
-                skip_point=False,
-            )
-    elif strat_info["mode"] == "place_inside":
-        if table.point == "On" and has_place5689 and place_nums != {5, 6, 8, 9}:
-            # assume that a place 5/6/8/9 has won
-            for bet_nm in ["Place5", "Place6", "Place8", "Place9"]:
-                player.remove_if_present(bet_nm)
-            strat_info["mode"] = "takedown"
-        else:
-            place(
-                player,
-                table,
-                unit,
-                strat_info={"numbers": {5, 6, 8, 9}},
-                skip_point=False,
-            )
-    elif strat_info["mode"] == "takedown" and table.point == "Off":
-        strat_info = None
-
+            strat_info["mode"] = "place68"
+        if place_nums:
+            _remove_place_bets(player, _NUMBERS_5689)
+        if point_off:
+            # the place68 phase makes no bets until the point is on
+            return strat_info
+
+    mode = strat_info["mode"]
+    if mode == "place68":
+        return _hammerlock_place68(player, table, unit, strat_info, place_nums)
+    if mode == "place_inside":
+        return _hammerlock_place_inside(player, table, unit, strat_info, place_nums)
+    # takedown: bets stay down until the point is off, which resets to place68
     return strat_info
 
 
 def risk12(player, table, unit=5, strat_info=None):
     passline(player, table, unit)
+    point_off = table.point.status == "Off"
+    point_number = table.point.number
+    last_roll = table.last_roll
+    field_double = table.payouts["fielddouble"]
+    field_triple = table.payouts["fieldtriple"]
 
     if table.pass_rolls == 0:
-        strat_info = {"winnings": 0}
-    elif table.point == "Off":
-        if table.last_roll in table.payouts["fielddouble"]:
+        if strat_info is None:
+            strat_info = {"winnings": 0}
+        else:
+            strat_info["winnings"] = 0
+    elif point_off:
+        if last_roll in field_double:
             # win double from the field, lose pass line, for a net of 1 unit win
             strat_info["winnings"] += unit
-        elif table.last_roll in table.payouts["fieldtriple"]:
+        elif last_roll in field_triple:
             # win triple from the field, lose pass line, for a net of 2 unit win
             strat_info["winnings"] += 2 * unit
-        elif table.last_roll == 11:
+        elif last_roll == 11:
             # win the field and pass line, for a net of 2 units win
             strat_info["winnings"] += 2 * unit
 
-    if table.point == "Off":
-        player.bet(
-            Field(
-                unit,
-                double=table.payouts["fielddouble"],
-                triple=table.payouts["fieldtriple"],
-            )
-        )
-        if table.last_roll == 7:
-            for bet_nm in ["Place6", "Place8"]:
-                player.remove_if_present(bet_nm)
-    elif table.point.number in [4, 9, 10]:
-        place(player, table, unit, strat_info={"numbers": {6, 8}})
-    elif table.point.number in [5, 6, 8]:
+    if point_off:
+        player.bet(Field(unit, double=field_double, triple=field_triple))
+        if last_roll == 7:
+            _remove_place_bets(player, _NUMBERS_68)
+    elif point_number in [4, 9, 10]:
+        place(player, table, unit, strat_info=_PLACE_68)
+    elif point_number in [5, 6, 8]:
         # lost field bet, so can't automatically cover the 6/8 bets.  Need to rely on potential early winnings
-        if strat_info["winnings"] >= 2 * unit:
-            place(player, table, unit, strat_info={"numbers": {6, 8}})
-        elif strat_info["winnings"] >= 1 * unit:
-            if table.point.number != 6:
-                place(player, table, unit, strat_info={"numbers": {6}})
+        winnings = strat_info["winnings"]
+        if winnings >= 2 * unit:
+            place(player, table, unit, strat_info=_PLACE_68)
+        elif winnings >= 1 * unit:
+            if point_number != 6:
+                place(player, table, unit, strat_info=_PLACE_6)
             else:
-                place(player, table, unit, strat_info={"numbers": {8}})
+                place(player, table, unit, strat_info=_PLACE_8)
 
     return strat_info
 
@@ -326,20 +385,21 @@ def knockout(player, table, unit=5, strat_info=None):
 
 
 def dicedoctor(player, table, unit=5, strat_info=None):
-    if strat_info is None or table.last_roll in Field(0).losing_numbers:
+    if strat_info is None:
         strat_info = {"progression": 0}
+    elif table.last_roll in Field.losing_numbers:
+        strat_info["progression"] = 0
     else:
         strat_info["progression"] += 1
 
-    bet_progression = [10, 20, 15, 30, 25, 50, 35, 70, 50, 100, 75, 150]
     prog = strat_info["progression"]
-    if prog < len(bet_progression):
-        amount = bet_progression[prog] * unit / 5
+    if prog < len(_DICEDOCTOR_PROGRESSION):
+        amount = _DICEDOCTOR_PROGRESSION[prog] * unit
     elif prog % 2 == 0:
         # alternate between second to last and last
-        amount = bet_progression[len(bet_progression) - 2] * unit / 5
+        amount = _DICEDOCTOR_PROGRESSION[-2] * unit
     else:
-        amount = bet_progression[len(bet_progression) - 1] * unit / 5
+        amount = _DICEDOCTOR_PROGRESSION[-1] * unit
 
     player.bet(
         Field(
@@ -357,58 +417,38 @@ def place68_cpr(player, table, unit=5, strat_info=None):
     ## NOTE: NOT WORKING
     if strat_info is None:
         strat_info = {"mode6": "collect", "mode8": "collect"}
+    bet_update_info = table.bet_update_info
+    base_amount = 6 / 5 * unit
 
-    if table.point == "On":
+    if table.point.status == "On":
         # always place 6 and 8 when they aren't place bets already
-        if not player.has_bet("Place6"):
-            player.bet(Place6(6 / 5 * unit))
-        if not player.has_bet("Place8"):
-            player.bet(Place8(6 / 5 * unit))
-
-    if table.bet_update_info is not None:
-        # place6
-        if player.has_bet("Place6"):
-            bet = player.get_bet("Place6")
-            if (
-                table.bet_update_info[player].get(bet.name) is not None
-            ):  # bet has not yet been updated; skip
-                # print("level3")
-                # print(table.bet_update_info[player][bet.name])
-                if table.bet_update_info[player][bet.name]["status"] == "win":
-                    # print("place6 mode: {}".format(strat_info["mode6"]))
-                    if strat_info["mode6"] == "press":
-                        player.remove(bet)
-                        player.bet(Place6(2 * bet.bet_amount))
-                        strat_info["mode6"] = "regress"
-                    elif strat_info["mode6"] == "regress":
-                        player.remove(bet)
-                        player.bet(Place6(6 / 5 * unit))
-                        strat_info["mode6"] = "collect"
-                    elif strat_info["mode6"] == "collect":
-                        strat_info["mode6"] = "press"
-                    # print("updated place6 mode: {}".format(strat_info["mode6"]))
-        # place8
-        if player.has_bet("Place8"):
-            bet = player.get_bet("Place8")
-            if (
-                table.bet_update_info[player].get(bet.name) is not None
-            ):  # bet has not yet been updated; skip
-                # print("level3")
-                # print(table.bet_update_info[player][bet.name])
-                if table.bet_update_info[player][bet.name]["status"] == "win":
-                    # print("place8 mode: {}".format(strat_info["mode8"]))
-                    if strat_info["mode8"] == "press":
-                        player.remove(bet)
-                        player.bet(Place8(2 * bet.bet_amount))
-                        strat_info["mode8"] = "regress"
-                    elif strat_info["mode8"] == "regress":
-                        player.remove(bet)
-                        player.bet(Place8(6 / 5 * unit))
-                        strat_info["mode8"] = "collect"
-                    elif strat_info["mode8"] == "collect":
-                        strat_info["mode8"] = "press"
-
-    print(strat_info)
+        for name, place_bet, mode in _CPR_BETS:
+            if not player.has_bet(name):
+                player.bet(place_bet(base_amount))
+
+    # a place 6 or 8 can only have won if the last roll was a 6 or an 8
+    if bet_update_info is not None and table.last_roll in _NUMBERS_68:
+        update_info = bet_update_info[player]
+        for name, place_bet, mode in _CPR_BETS:
+            place_bets = player.get_bets_by_type(place_bet)
+            if not place_bets:
+                continue
+            bet = place_bets[0]
+            info = update_info.get(name)
+            if info is None:  # bet has not yet been updated; skip
+                continue
+            if info["status"] == "win":
+                current_mode = strat_info[mode]
+                if current_mode != "collect":
+                    # press doubles the bet, regress drops it back to the base amount
+                    if current_mode == "press":
+                        new_amount = 2 * bet.bet_amount
+                    else:
+                        new_amount = base_amount
+                    player.remove(bet)
+                    player.bet(place_bet(new_amount))
+                strat_info[mode] = _CPR_NEXT_MODE[current_mode]
+
     return strat_info
 
 
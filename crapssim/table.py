@@ -34,6 +34,20 @@ class Table(object):
         name, this is status of last bet (win/loss), and win amount.
     """
 
+    __slots__ = (
+        "players",
+        "player_has_bets",
+        "strat_info",
+        "point",
+        "dice",
+        "bet_update_info",
+        "payouts",
+        "pass_rolls",
+        "last_roll",
+        "n_shooters",
+        "total_player_cash",
+    )
+
     def __init__(self):
         self.players = []
         self.player_has_bets = False
@@ -51,7 +65,7 @@ class Table(object):
     def with_payouts(cls, **kwagrs):
         table = cls()
         for name, value in kwagrs.items():
-            table.payouts[name] = value
+            table.set_payouts(name, value)
         return table
 
     def set_payouts(self, name, value):
@@ -88,7 +102,7 @@ class Table(object):
 
         # maybe wrap this into update table or something
         self.total_player_cash = sum(
-            [p.total_bet_amount + p.bankroll for p in self.players]
+            p.total_bet_amount + p.bankroll for p in self.players
         )
 
         continue_rolling = True
@@ -96,11 +110,12 @@ class Table(object):
 
             # players make their bets
             self._add_player_bets()
-            for p in self.players:
-                bets = [
-                    f"{b.name}{b.subname}, ${b.bet_amount}" for b in p.bets_on_table
-                ]
-                if verbose:
+            if verbose:
+                for p in self.players:
+                    bets = [
+                        f"{b.name}{b.subname}, ${b.bet_amount}"
+                        for b in p.bets_on_table
+                    ]
                     print(f"{p.name}'s current bets: {bets}")
 
             self.dice.roll()
@@ -131,42 +146,53 @@ class Table(object):
         """ Implement each player's betting strategy """
         """ TODO: restrict bets that shouldn't be possible based on table"""
         """ TODO: Make the unit parameter specific to each player, and make it more general """
+        strat_info = self.strat_info
         for p in self.players:
-            self.strat_info[p] = p._add_strategy_bets(
-                self, unit=5, strat_info=self.strat_info[p]
+            strat_info[p] = p._add_strategy_bets(
+                self, unit=5, strat_info=strat_info[p]
             )  # unit = 10 to change unit
             # TODO: add player.strat_kwargs as optional parameter (currently manually changed in CrapsTable)
 
     def _update_player_bets(self, dice, verbose=False):
         """ check bets for wins/losses, payout wins to their bankroll, remove bets that have resolved """
-        self.bet_update_info = {}
+        bet_update_info = {}
+        # a player's cash and bets are final once their own bets are updated,
+        # so the table totals are gathered in the same pass
+        total_player_cash = 0
+        n_bets = 0
         for p in self.players:
-            info = p._update_bet(self, dice, verbose)
-            self.bet_update_info[p] = info
+            bet_update_info[p] = p._update_bet(self, dice, verbose)
+            total_player_cash += p.total_bet_amount + p.bankroll
+            n_bets += len(p.bets_on_table)
+        self.bet_update_info = bet_update_info
+        self.total_player_cash = total_player_cash
+        self.player_has_bets = n_bets >= 1
 
     def _update_table(self, dice):
         """ update table attributes based on previous dice roll """
+        total = dice.total
+        point = self.point
         self.pass_rolls += 1
-        if self.point == "On" and dice.total == 7:
-            self.n_shooters += 1
-        if self.point == "On" and (dice.total == 7 or dice.total == self.point.number):
+        # read status directly rather than going through _Point.__eq__
+        if point.status == "On" and (total == 7 or total == point.number):
+            if total == 7:
+                self.n_shooters += 1
             self.pass_rolls = 0
 
-        self.point.update(self.dice)
-        self.total_player_cash = sum(
-            [p.total_bet_amount + p.bankroll for p in self.players]
-        )
-        self.player_has_bets = sum([len(p.bets_on_table) for p in self.players]) >= 1
-        self.last_roll = dice.total
+        point.update(dice)
+        self.last_roll = total
 
     def _get_player(self, player_name):
-        [p for p in self.players if p.name == player_name]
         for p in self.players:
             if p.name == player_name:
                 return p
         return False
 
 
+# bit n is set for each total n that sets a point (4, 5, 6, 8, 9, 10)
+_POINT_NUMBERS_MASK = 0b11101110000
+
+
 class _Point(object):
     """
     The point on a craps table.
@@ -183,18 +209,24 @@ class _Point(object):
         The point number (in [4, 5, 6, 8, 9, 10]) is status == 'On'
     """
 
+    __slots__ = ("status", "number")
+
     def __init__(self):
         self.status = "Off"
         self.number = None
 
     def __eq__(self, other):
-        return self.status == other
+        if type(other) is str:
+            return self.status == other
+        return NotImplemented
 
     def update(self, dice_object: Dice):
-        if self.status == "Off" and dice_object.total in [4, 5, 6, 8, 9, 10]:
-            self.status = "On"
-            self.number = dice_object.total
-        elif self.status == "On" and dice_object.total in [7, self.number]:
+        total = dice_object.total
+        if self.status == "Off":
+            if (_POINT_NUMBERS_MASK >> total) & 1:
+                self.status = "On"
+                self.number = total
+        elif total == 7 or total == self.number:
             self.status = "Off"
             self.number = None
 
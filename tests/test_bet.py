@@ -0,0 +1,31 @@
+import pytest
+from crapssim.bet import PassLine, Odds, DontPass, LayOdds
+from crapssim.bet import Place4, Place5, Place6, Place8, Place9, Place10
+
+
+@pytest.mark.parametrize(
+    "point, ratio", [(4, 2), (5, 3 / 2), (6, 6 / 5), (8, 6 / 5), (9, 3 / 2), (10, 2)]
+)
+def test_odds_payout(point, ratio):
+    passline = PassLine(5)
+    passline.winning_numbers = [point]
+    assert Odds(10, passline).payoutratio == ratio
+
+
+@pytest.mark.parametrize(
+    "point, ratio", [(4, 1 / 2), (5, 2 / 3), (6, 5 / 6), (8, 5 / 6), (9, 2 / 3), (10, 1 / 2)]
+)
+def test_lay_odds_payout(point, ratio):
+    dontpass = DontPass(5)
+    dontpass.losing_numbers = [point]
+    assert LayOdds(10, dontpass).payoutratio == ratio
+
+
+def test_odds_before_point_keeps_default_payout():
+    assert Odds(10, PassLine(5)).payoutratio == 1.0
+
+
+@pytest.mark.parametrize("place_bet", [Place4, Place5, Place6, Place8, Place9, Place10])
+def test_place_number(place_bet):
+    bet = place_bet(5)
+    assert bet.winning_numbers == [bet.number]
@@ -12,6 +12,12 @@ def test_one_roll(d1):
     d1.roll()
     assert d1.n_rolls == 1
 
+def test_roll_total(d1):
+    d1.roll()
+    assert type(d1.total) is int
+    assert d1.total == sum(d1.result)
+    assert 2 <= d1.total <= 12
+
 def test_many_roll(d1):
     d1.roll()
     d1.roll()
@@ -29,4 +35,14 @@ def test_many_roll(d1):
 def test_fixed_roll(d1, roll, total):
     d1.fixed_roll(roll)
     assert d1.result == roll
-    assert d1.total == total
\ No newline at end of file
+    assert d1.total == total
+
+def test_rolls_past_one_block(d1):
+    totals = set()
+    for _ in range(3 * Dice._BLOCK_SIZE):
+        d1.roll()
+        assert d1.result.shape == (2,)
+        assert d1.total == sum(d1.result)
+        totals.add(d1.total)
+    assert d1.n_rolls == 3 * Dice._BLOCK_SIZE
+    assert totals == set(range(2, 13))
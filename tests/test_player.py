@@ -0,0 +1,101 @@
+import pytest
+from crapssim.player import Player
+from crapssim.table import Table
+from crapssim.bet import Bet, PassLine, Come, Place, Place6, Place8
+
+@pytest.fixture
+def player():
+    return Player(100)
+
+def test_bets_indexed_by_type(player):
+    place6 = Place6(6)
+    come = Come(5)
+    player.bet(place6)
+    player.bet(come)
+    assert player.get_bets_by_type(Place) == (place6,)
+    assert player.get_bets_by_type(PassLine) == (come,)
+    assert player.get_bets_by_type(Bet) == (place6, come)
+
+def test_remove_updates_index(player):
+    place6 = Place6(6)
+    place8 = Place8(6)
+    player.bet(place6)
+    player.bet(place8)
+    player.remove(place6)
+    assert player.bets_on_table == [place8]
+    assert player.get_bets_by_type(Place) == (place8,)
+    assert player.get_bets_by_type(Place6) == ()
+
+def test_has_bet(player):
+    come1 = Come(5)
+    come2 = Come(5)
+    player.bet(come1)
+    player.bet(come2)
+    assert player.has_bet("Come")
+    assert player.has_bet("PassLine", "Come")
+    assert not player.has_bet("PassLine")
+    player.remove(come1)
+    assert player.has_bet("Come")
+    player.remove(come2)
+    assert not player.has_bet("Come")
+
+def test_num_bet(player):
+    player.bet(Come(5))
+    player.bet(Come(5))
+    player.bet(PassLine(5))
+    assert player.num_bet("Come") == 2
+    assert player.num_bet("Come", "PassLine") == 3
+    assert player.num_bet("Place6") == 0
+
+def test_get_bet(player):
+    come = Come(5)
+    come.subname = "6"
+    player.bet(PassLine(5))
+    player.bet(come)
+    assert player.get_bet("Come", "Any") is come
+    assert player.get_bet("Come", "6") is come
+    with pytest.raises(ValueError):
+        player.get_bet("Come")
+
+def test_remove_bet_not_on_table(player):
+    player.bet(Place6(6))
+    player.remove(Place6(6))
+    assert len(player.bets_on_table) == 1
+    assert player.bankroll == 94
+
+def test_update_bet_removes_resolved_bets(player):
+    table = Table()
+    place6 = Place6(6)
+    passline = PassLine(5)
+    player.bet(place6)
+    player.bet(passline)
+    table.dice.fixed_roll([3, 4])
+    info = player._update_bet(table, table.dice)
+    assert info["PassLine"]["status"] == "win"
+    assert info["Place6"]["status"] is None
+    assert player.bets_on_table == [place6]
+    assert player.get_bets_by_type(PassLine) == ()
+    assert not player.has_bet("PassLine")
+    assert player.bankroll == 99
+
+def test_get_bets_by_type(player):
+    place6 = Place6(6)
+    come = Come(5)
+    passline = PassLine(5)
+    for bet in (place6, come, passline):
+        player.bet(bet)
+    assert player.get_bets_by_type(Place) == (place6,)
+    assert player.get_bets_by_type(PassLine) == (come, passline)
+    assert player.get_bets_by_type(Place, Come) == (place6, come)
+    assert player.get_bets_by_type(Place8) == ()
+
+def test_strategy_gets_unit_and_strat_info_by_keyword():
+    calls = []
+
+    def strategy(player, table, strat_info=None, **kwargs):
+        calls.append((strat_info, kwargs))
+        return "info"
+
+    player = Player(100, strategy)
+    assert player._add_strategy_bets(None, unit=10, strat_info="old") == "info"
+    assert calls == [("old", {"unit": 10})]
@@ -0,0 +1,166 @@
+import pytest
+import crapssim as craps
+from crapssim.strategy import place, dicedoctor, passline_odds, hammerlock, place68_cpr, place68_2come
+from crapssim.strategy import _remove_place_bets
+
+@pytest.fixture
+def table():
+    return craps.Table()
+
+@pytest.fixture
+def player():
+    return craps.Player(100)
+
+def set_point(table, roll):
+    table.dice.fixed_roll(roll)
+    table.point.update(table.dice)
+
+def test_place_no_bets_point_off(table, player):
+    place(player, table, strat_info={"numbers": {6, 8}})
+    assert player.bets_on_table == []
+
+def test_place_skips_point(table, player):
+    set_point(table, [3, 3])
+    place(player, table, strat_info={"numbers": {5, 6, 8}})
+    assert sorted(b.name for b in player.bets_on_table) == ["Place5", "Place8"]
+
+def test_place_does_not_modify_strat_info(table, player):
+    set_point(table, [3, 3])
+    strat_info = {"numbers": {4, 6, 8, 11}}
+    place(player, table, strat_info=strat_info)
+    assert strat_info == {"numbers": {4, 6, 8, 11}}
+
+def test_place_takes_down_point_bet(table, player):
+    set_point(table, [3, 3])
+    player.bet(craps.bet.Place6(6))
+    place(player, table, strat_info={"numbers": {6, 8}})
+    assert [b.name for b in player.bets_on_table] == ["Place8"]
+    assert player.bankroll == 94
+
+def test_place_default_numbers(table, player):
+    set_point(table, [2, 2])
+    place(player, table)
+    assert sorted(b.name for b in player.bets_on_table) == ["Place6", "Place8"]
+
+def test_remove_place_bets(player):
+    for place_bet in (craps.bet.Place5, craps.bet.Place6, craps.bet.Place8):
+        player.bet(place_bet(5))
+    player.bet(craps.bet.PassLine(5))
+    _remove_place_bets(player, {6, 8, 9})
+    assert [b.name for b in player.bets_on_table] == ["Place5", "PassLine"]
+    assert player.bankroll == 90
+
+def test_field_payouts_follow_table():
+    table = craps.Table.with_payouts(fielddouble=[2], fieldtriple=[12])
+    player = craps.Player(100)
+    table.dice.fixed_roll([1, 1])
+    dicedoctor(player, table)
+    field = player.get_bet("Field")
+    assert 12 in field.triple_winning_numbers
+    assert 12 not in field.double_winning_numbers
+
+def roll(table, dice):
+    """ one pass of Table.run with fixed dice """
+    table._add_player_bets()
+    table.dice.fixed_roll(dice)
+    table._update_player_bets(table.dice)
+    table._update_table(table.dice)
+
+def replay(strategy, rolls, bankroll=100):
+    """ play rolls on a fresh table, checking (point, bets, bankroll[, strat_info]) after each """
+    table = craps.Table()
+    player = craps.Player(bankroll, strategy)
+    table.add_player(player)
+    for i, (dice, point, bets, bank, *info) in enumerate(rolls):
+        roll(table, dice)
+        expected = (point, sorted(bets), bank, *info)
+        actual = (
+            table.point.number,
+            sorted((b.name, b.bet_amount) for b in player.bets_on_table),
+            player.bankroll,
+            table.strat_info[player],
+        )
+        assert actual[:len(expected)] == expected, f"roll {i}: {dice}"
+
+PL = ("PassLine", 5)
+ODDS = ("Odds", 5)
+
+# (dice, point after, bets after, bankroll after) for one continuous shooter sequence
+PASSLINE_ODDS_ROLLS = [
+    ((5, 5), 10, [PL], 95),
+    ((4, 3), None, [], 90),
+    ((5, 1), 6, [PL], 85),
+    ((3, 3), None, [], 101),
+    ((6, 5), None, [], 106),
+    ((1, 1), None, [], 101),
+    ((2, 2), 4, [PL], 96),
+    ((3, 2), 4, [PL, ODDS], 91),
+    ((2, 2), None, [], 116),
+]
+
+def test_passline_odds_replay():
+    replay(passline_odds, PASSLINE_ODDS_ROLLS)
+
+DP = ("DontPass", 5)
+LAY = ("LayOdds", 30)
+
+# (dice, point after, bets after, bankroll after, strat_info after)
+HAMMERLOCK_ROLLS = [
+    ((2, 2), 4, [PL, DP], 190, {"mode": "place68"}),
+    ((3, 3), 4, [PL, DP, LAY, ("Place8", 12)], 162, {"mode": "place68"}),
+    ((4, 4), 4, [PL, DP, LAY, ("Place5", 5), ("Place6", 6), ("Place9", 5)], 165, {"mode": "place_inside"}),
+    ((2, 3), 4, [PL, DP, LAY], 181, {"mode": "takedown"}),
+    ((3, 3), 4, [PL, DP, LAY], 181, {"mode": "takedown"}),
+    ((3, 4), None, [], 236, {"mode": "takedown"}),
+    ((5, 5), 10, [PL, DP], 226, {"mode": "place68"}),
+    ((3, 3), 10, [PL, DP, LAY, ("Place8", 12)], 198, {"mode": "place68"}),
+    ((4, 3), None, [], 243, {"mode": "place_inside"}),
+]
+
+def test_hammerlock_replay():
+    replay(hammerlock, HAMMERLOCK_ROLLS, bankroll=200)
+
+def test_field_payouts_follow_direct_assignment():
+    table = craps.Table()
+    table.payouts["fielddouble"] = [2]
+    player = craps.Player(100)
+    table.dice.fixed_roll([1, 1])
+    dicedoctor(player, table)
+    field = player.get_bet("Field")
+    assert 12 not in field.double_winning_numbers
+
+def cpr_modes(mode6, mode8):
+    return {"mode6": mode6, "mode8": mode8}
+
+# each place bet steps through collect, press, regress as it wins
+PLACE68_CPR_ROLLS = [
+    ((2, 2), 4, [], 200, cpr_modes("collect", "collect")),
+    ((3, 3), 4, [("Place8", 6)], 201, cpr_modes("collect", "collect")),
+    ((4, 4), 4, [("Place6", 6)], 208, cpr_modes("press", "collect")),
+    ((3, 3), 4, [("Place8", 6)], 215, cpr_modes("press", "press")),
+    ((4, 4), 4, [("Place6", 12)], 216, cpr_modes("regress", "press")),
+    ((3, 3), 4, [("Place8", 12)], 230, cpr_modes("regress", "regress")),
+    ((4, 4), 4, [("Place6", 6)], 250, cpr_modes("collect", "regress")),
+    ((2, 3), 4, [("Place6", 6), ("Place8", 6)], 244, cpr_modes("collect", "collect")),
+    ((3, 4), None, [], 244, cpr_modes("collect", "collect")),
+]
+
+def test_place68_cpr_replay():
+    replay(place68_cpr, PLACE68_CPR_ROLLS, bankroll=200)
+
+COME = ("Come", 5)
+
+# come bets that land on 6 or 8 move that place bet to 5 or 9
+PLACE68_2COME_ROLLS = [
+    ((2, 2), 4, [], 200),
+    ((3, 3), 4, [COME, ("Place8", 6)], 196),
+    ((4, 4), 4, [COME, COME, ("Place5", 5)], 199),
+    ((3, 3), 4, [COME, ("Place5", 5), ("Place9", 5)], 204),
+    ((2, 2), None, [COME, ("Place5", 5), ("Place6", 6), ("Place9", 5)], 198),
+    ((4, 4), 8, [("Place5", 5), ("Place6", 6), ("Place9", 5)], 208),
+    ((5, 5), 8, [("Place5", 5), ("Place6", 6), ("Place8", 6), ("Place9", 5)], 202),
+    ((3, 4), None, [], 202),
+]
+
+def test_place68_2come_replay():
+    replay(place68_2come, PLACE68_2COME_ROLLS, bankroll=200)